@@ -1,25 +1,58 @@
 import os
+import collections
 from flask import Flask, request, jsonify, send_file, Response
+from flask.json.provider import JSONProvider
+import orjson
 from flask_cors import CORS
 from flask_apscheduler import APScheduler
-import yt_dlp as youtube_dl
 import uuid
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
+import logging.handlers
+import queue
+import atexit
 from dotenv import load_dotenv
 from urllib.parse import unquote, quote
 from functools import lru_cache
 import time
+import threading
 from concurrent.futures import ThreadPoolExecutor
 import sqlite3
+import socket
+import subprocess
 from contextlib import contextmanager
 import hashlib
+from cachetools import TTLCache
 
 # Load environment variables
 load_dotenv()
 
+# Cache DNS lookups process-wide: yt-dlp resolves the same few hosts
+# (youtube.com, *.googlevideo.com, ...) dozens of times per download, and
+# the results are stable on the minutes scale
+_GAI_TTL = 60  # seconds
+# TTLCache evicts expired entries on access and caps the key space - the
+# rotating googlevideo CDN hostnames alone would grow a plain dict for
+# the life of the process
+_gai_cache = TTLCache(maxsize=1024, ttl=_GAI_TTL)
+_gai_lock = threading.Lock()
+_orig_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    with _gai_lock:
+        hit = _gai_cache.get(key)
+    if hit is not None:
+        return hit
+    result = _orig_getaddrinfo(host, port, *args, **kwargs)
+    with _gai_lock:
+        _gai_cache[key] = result
+    return result
+
+socket.getaddrinfo = _cached_getaddrinfo
+
 # Initialize Flask app with optimized settings
 app = Flask(__name__, static_folder='../frontend/build', static_url_path='/')
 app.config.update({
@@ -29,6 +62,23 @@ app.config.update({
     'JSON_SORT_KEYS': False,
 })
 
+# Serialize JSON responses with orjson (C implementation) - the yt-dlp
+# formats payload can be tens of KB and stdlib json is the bottleneck there
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # orjson emits bytes; handing them straight to the response skips
+        # the decode-to-str in dumps() and Flask's re-encode back to bytes
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+app.json = ORJSONProvider(app)
+
 # Configure CORS with pre-compiled regex for faster matching
 CORS(app, resources={
     r"/api/.*": {
@@ -46,53 +96,176 @@ CORS(app, resources={
 # Configuration
 DOWNLOAD_FOLDER = Path(os.getenv('DOWNLOAD_FOLDER', 'downloads'))
 DOWNLOAD_FOLDER.mkdir(exist_ok=True, parents=True)
+# Resolved once at startup; the folder never moves, so per-request
+# realpath walks in the traversal check are wasted syscalls
+DOWNLOAD_FOLDER_RESOLVED = DOWNLOAD_FOLDER.resolve()
+DOWNLOAD_FOLDER_STR = str(DOWNLOAD_FOLDER)
+# Trailing separator so "downloads_evil/x" can't pass the prefix check
+DOWNLOAD_ROOT = str(DOWNLOAD_FOLDER_RESOLVED) + os.sep
 MAX_FILENAME_LENGTH = 100
 CLEANUP_OLDER_THAN = timedelta(hours=24)
-MAX_CONCURRENT_DOWNLOADS = 4
+# Downloads are I/O bound, so the old hard cap of 4 left bandwidth idle;
+# tunable per deployment without a code change
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv('PRACKY_MAX_DL', '16'))
+# Persistent yt-dlp cache so extractor state survives worker restarts
+YDL_CACHE_DIR = os.getenv('YDL_CACHE_DIR', str(Path('.yt-dlp-cache').absolute()))
+
+# Thread pool for downloads: sized wider than the cap so bursts queue in
+# cheap threads, while the semaphore throttles actual yt-dlp work
+DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS * 2)
+DOWNLOAD_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_DOWNLOADS)
+atexit.register(DOWNLOAD_EXECUTOR.shutdown)
+
+# CPU-bound transcodes run on their own pool so a slow conversion never
+# occupies a download slot; sized to the cores ffmpeg can actually use
+FFMPEG_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+atexit.register(FFMPEG_EXECUTOR.shutdown)
+
+# In-memory job table so status polls don't hit SQLite; the downloads
+# table remains the durable record across restarts
+JOBS = {}
+# (url, format_id) -> download_id for jobs still running, so concurrent
+# requests for the same video share one download instead of N
+INFLIGHT = {}
+_JOBS_LOCK = threading.Lock()
+# Terminal jobs linger this long for status polls, then cleanup prunes
+# them; the downloads table answers for them from that point on
+JOB_RETENTION_SECONDS = 3600
 
-# Thread pool for downloads
-DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS)
+def set_job_state(download_id, state, **fields):
+    with _JOBS_LOCK:
+        job = JOBS.setdefault(download_id, {})
+        job['state'] = state
+        job.update(fields)
+        if state in ('completed', 'error'):
+            job['ended_at'] = time.monotonic()
+            # Progress snapshots are only meaningful while the job runs;
+            # dropping them here keeps both dicts bounded by active jobs
+            _PROGRESS.pop(download_id, None)
+            _PROGRESS_TS.pop(download_id, None)
 
 # Database for tracking downloads
 DB_PATH = Path('downloads.db')
 init_db_called = False
 
 # Setup optimized logging
+class RingBufferHandler(logging.Handler):
+    """Keeps the most recent log records in RAM so /api/logs never reads from disk"""
+    def __init__(self, capacity=200):
+        super().__init__()
+        self.buf = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.buf.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+ring_handler = RingBufferHandler()
+
+# File/console writes happen on a background listener thread so request
+# threads only enqueue records instead of blocking on disk I/O
+_log_queue = queue.Queue(-1)
+# MemoryHandler batches routine records into one write per 512 entries;
+# anything at ERROR (or shutdown) flushes the buffer immediately, so
+# tracebacks never sit unwritten behind INFO chatter
+_file_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler('server.log')
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    _file_handler
+)
+# atexit runs LIFO: flush registered first so it fires after the
+# listener has drained its queue into the memory buffer
+atexit.register(_file_handler.flush)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('server.log')
+        logging.handlers.QueueHandler(_log_queue),
+        ring_handler
     ]
 )
 logger = logging.getLogger("PrackyDownloader")
 logger.setLevel(logging.INFO)
 
+# Single-pass translate table beats re.sub for one-char substitutions
+FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys('\\/*?:"<>|', '_'))
 # Pre-compile regex patterns for faster matching
-FILENAME_SANITIZE_PATTERN = re.compile(r'[\\/*?:"<>|]')
-FILENAME_VALIDATE_PATTERN = re.compile(r'^[\w\s\-\.#]+$')
+# \A...\Z anchors match absolute string bounds ($ also matches before a
+# trailing newline, which would let "name\n" through)
+FILENAME_VALIDATE_PATTERN = re.compile(r'\A[\w\s\-\.#]+\Z')
 URL_HASH_PATTERN = re.compile(r'^[a-f0-9]{32}$')
 
+@lru_cache(maxsize=4096)
+def _filename_ok(filename):
+    """Memoized filename validation - repeat GETs for the same file
+    (browsers re-request, players seek) become a dict hit instead of a
+    regex scan"""
+    return FILENAME_VALIDATE_PATTERN.match(filename) is not None
+
 # Initialize scheduler
 scheduler = APScheduler()
 scheduler.init_app(app)
 scheduler.start()
 
-# Database functions
-@contextmanager
-def get_db():
-    conn = sqlite3.connect(DB_PATH, timeout=10)
+# Database functions. Opening a fresh sqlite connection per query pays
+# connection setup plus a cold page cache on every tiny statement, so
+# reads come from a bounded pool of long-lived connections and writes are
+# serialized through one dedicated connection (SQLite serializes writers
+# internally anyway).
+DB_POOL_SIZE = 8
+
+def _make_db_connection(read_only=False):
+    # sqlite3 keeps compiled statements per connection keyed by SQL text;
+    # a larger cache keeps every hot statement's parse+plan amortized
+    conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False,
+                           cached_statements=256)
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    # Batch WAL checkpoints so burst writes don't pay checkpoint cost
+    # mid-burst, and mmap the database file (256MB) for reads
+    conn.execute('PRAGMA wal_autocheckpoint=1000')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-64000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    if read_only:
+        # Guards against accidental writes through the read pool, and
+        # lets SQLite skip write-path bookkeeping on these connections
+        conn.execute('PRAGMA query_only=true')
+    return conn
+
+_READ_POOL = queue.Queue(maxsize=DB_POOL_SIZE)
+for _ in range(DB_POOL_SIZE):
+    _READ_POOL.put(_make_db_connection(read_only=True))
+
+_WRITE_CONN = _make_db_connection()
+_WRITE_LOCK = threading.Lock()
+
+@contextmanager
+def get_db(write=False):
+    if write:
+        with _WRITE_LOCK:
+            yield _WRITE_CONN
+    else:
+        conn = _READ_POOL.get()
+        try:
+            yield conn
+        finally:
+            _READ_POOL.put(conn)
 
 def init_db():
     global init_db_called
     if not init_db_called:
-        with get_db() as conn:
+        with get_db(write=True) as conn:
             conn.execute('''
             CREATE TABLE IF NOT EXISTS downloads (
                 id TEXT PRIMARY KEY,
@@ -108,139 +281,380 @@ def init_db():
             ''')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_url_hash ON downloads(url_hash)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_status ON downloads(status)')
+            # Partial index so the expiry scan is O(completed rows), not O(table)
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cleanup
+                ON downloads(completed_at) WHERE status = 'completed'
+            ''')
             conn.commit()
         init_db_called = True
 
+@lru_cache(maxsize=1024)
+def _url_key(url):
+    """Dedup key for a URL. This is not a security hash, so use blake2b
+    (SIMD-accelerated) over md5; digest_size=16 keeps the same 32-char hex
+    the schema already stores. Memoized so repeat URLs skip hashing."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
 def record_download_start(download_id, filename, url, ip_address):
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    with get_db() as conn:
+    url_hash = _url_key(url)
+    with get_db(write=True) as conn:
         conn.execute(
             'INSERT INTO downloads (id, filename, url, url_hash, status, ip_address) VALUES (?, ?, ?, ?, ?, ?)',
             (download_id, filename, url, url_hash, 'started', ip_address)
         )
         conn.commit()
 
-def record_download_complete(download_id, filesize):
-    with get_db() as conn:
+def record_download_complete(download_id, filesize, url=None):
+    # The writer connection is persistent, so sqlite3's per-connection
+    # statement cache reuses the compiled UPDATE across completions
+    with get_db(write=True) as conn:
         conn.execute(
             'UPDATE downloads SET status = ?, completed_at = CURRENT_TIMESTAMP, filesize = ? WHERE id = ?',
             ('completed', filesize, download_id)
         )
         conn.commit()
+    if url is not None:
+        # Drop any stale (often negative) cached lookup so the fresh file
+        # is visible to the next request
+        with _EXISTS_LOCK:
+            _EXISTS_CACHE.pop(_url_key(url), None)
+
+# Popular URLs get looked up on every /api/info and /api/download hit;
+# cache the answer briefly so repeats skip the md5 + SELECT round-trip
+_EXISTS_CACHE = TTLCache(maxsize=2048, ttl=60)
+_EXISTS_LOCK = threading.Lock()
+_EXISTS_MISS = object()  # sentinel: None is a valid (negative) cached answer
 
 def check_existing_download(url):
-    url_hash = hashlib.md5(url.encode()).hexdigest()
+    url_hash = _url_key(url)
+    with _EXISTS_LOCK:
+        cached = _EXISTS_CACHE.get(url_hash, _EXISTS_MISS)
+    if cached is not _EXISTS_MISS:
+        return cached
     with get_db() as conn:
         row = conn.execute(
             'SELECT filename FROM downloads WHERE url_hash = ? AND status = ? ORDER BY completed_at DESC LIMIT 1',
             (url_hash, 'completed')
         ).fetchone()
-        return row['filename'] if row else None
+        result = row['filename'] if row else None
+    with _EXISTS_LOCK:
+        _EXISTS_CACHE[url_hash] = result
+    return result
+
+# Per-download progress state. Hooks assign a fresh dict in one statement,
+# which is atomic in CPython, so readers never need a lock.
+_PROGRESS = {}
+_PROGRESS_TS = {}
+_FINAL_PATHS = {}  # download_id -> path reported by the 'finished' hook
+PROGRESS_UPDATE_INTERVAL = 0.25  # seconds between recorded updates
+PROGRESS_LOG_BATCH = 64  # ticks aggregated into one debug record
+
+def make_progress_hook(download_id):
+    """Build a throttled yt-dlp progress hook for one download"""
+    pending = []
+
+    def hook(d):
+        status = d.get('status')
+        if status == 'finished':
+            path = d.get('info_dict', {}).get('_filename') or d.get('filename')
+            if path:
+                _FINAL_PATHS[download_id] = path
+        # Batch tick logging: one debug record per PROGRESS_LOG_BATCH ticks
+        # (or status change) instead of one per callback
+        pending.append((d.get('downloaded_bytes'), d.get('speed')))
+        if len(pending) >= PROGRESS_LOG_BATCH or status != 'downloading':
+            logger.debug(
+                'Progress %s: %d ticks, %s bytes, %s B/s',
+                download_id, len(pending), pending[-1][0], pending[-1][1]
+            )
+            pending.clear()
+        now = time.monotonic()
+        if status == 'downloading' and now - _PROGRESS_TS.get(download_id, 0) < PROGRESS_UPDATE_INTERVAL:
+            return
+        _PROGRESS_TS[download_id] = now
+        _PROGRESS[download_id] = {
+            'status': status,
+            'downloaded_bytes': d.get('downloaded_bytes'),
+            'total_bytes': d.get('total_bytes') or d.get('total_bytes_estimate'),
+            'speed': d.get('speed'),
+        }
+    return hook
 
 # Optimized helper functions
 def sanitize_filename(filename):
     """Ultra-fast filename sanitization"""
     if not filename:
         return "untitled"
-    filename = FILENAME_SANITIZE_PATTERN.sub("_", filename)
-    if len(filename) > MAX_FILENAME_LENGTH:
-        return filename[:MAX_FILENAME_LENGTH]
-    return filename
-
-@lru_cache(maxsize=512)
-def get_video_info_cached(url, cache_key):
-    """Highly optimized video info fetcher with aggressive caching"""
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'simulate': True,
-        'extract_flat': False,
-        'ignoreerrors': True,
-        'noplaylist': True,
-        'socket_timeout': 8,
-        'extractor_args': {
-            'youtube': {
-                'skip': ['dash', 'hls', 'translated_subs'],
-                'player_skip': ['js'],
-                'player_client': ['android']
-            },
-            'instagram': {'extract_flat': True},
-            'facebook': {'extract_flat': True}
+    return filename.translate(FILENAME_SANITIZE_TABLE)[:MAX_FILENAME_LENGTH]
+
+INFO_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'simulate': True,
+    'extract_flat': False,
+    'ignoreerrors': True,
+    'noplaylist': True,
+    'socket_timeout': 8,
+    'extractor_args': {
+        'youtube': {
+            'skip': ['dash', 'hls', 'translated_subs'],
+            'player_skip': ['js'],
+            'player_client': ['android']
         },
-        'force_ipv4': True,
-        'geo_bypass': True,
-        'geo_bypass_country': 'US'
-    }
-    
+        'instagram': {'extract_flat': True},
+        'facebook': {'extract_flat': True}
+    },
+    'force_ipv4': True,
+    'geo_bypass': True,
+    'geo_bypass_country': 'US',
+    'cachedir': YDL_CACHE_DIR
+}
+
+# yt-dlp is imported lazily: loading it pulls in hundreds of extractor
+# modules, which endpoints like /api/logs and /api/status never need
+_youtube_dl = None
+
+def _load_youtube_dl():
+    global _youtube_dl
+    if _youtube_dl is None:
+        import yt_dlp
+        _youtube_dl = yt_dlp
+    return _youtube_dl
+
+# Long-lived YoutubeDL instances keyed by frozen option set. Reuse keeps
+# the urllib opener (and its TLS connections) alive across requests
+# instead of rebuilding them per call.
+_YDL_POOL = {}
+_YDL_LOCK = threading.Lock()
+
+def _freeze_opts(value):
+    """Recursively convert an options structure into a hashable key"""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze_opts(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_opts(v) for v in value)
+    return value
+
+def get_ydl(opts):
+    """Return a shared YoutubeDL for this option set, constructing lazily"""
+    key = _freeze_opts(opts)
+    with _YDL_LOCK:
+        ydl = _YDL_POOL.get(key)
+        if ydl is None:
+            ydl = _YDL_POOL[key] = _load_youtube_dl().YoutubeDL(opts)
+        return ydl
+
+# Video info cache: url -> info, bounded and expired by age. A per-URL
+# Event coalesces concurrent misses so only one thread hits yt-dlp per URL.
+INFO_CACHE_TTL = 300  # seconds
+_INFO_CACHE = TTLCache(maxsize=1024, ttl=INFO_CACHE_TTL)
+# Failed extractions are remembered briefly so a broken URL being polled
+# by a client doesn't hammer yt-dlp; short TTL so transient errors clear
+_INFO_NEG_CACHE = TTLCache(maxsize=256, ttl=30)
+_INFO_FUTURES = {}
+_INFO_LOCK = threading.Lock()
+
+# Separate pool from DOWNLOAD_EXECUTOR so metadata bursts (a playlist
+# expansion, say) can't be starved by long-running downloads
+INFO_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+atexit.register(INFO_EXECUTOR.shutdown)
+
+def _warm_yt_dlp():
+    """Force extractor imports and opener construction at worker boot so
+    the first user-facing request doesn't pay the ~1s lazy-load cost"""
     try:
-        with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            if not info:
-                raise ValueError("No video information could be extracted")
-                
-            # Platform-specific optimizations
-            if 'extractor' in info and info['extractor'] in ['instagram', 'facebook']:
-                return {
-                    'title': info.get('title', 'Instagram Video') if 'instagram' in info['extractor'] else 'Facebook Video',
-                    'thumbnail': info.get('thumbnail'),
-                    'duration': info.get('duration', 0),
-                    'formats': [{
-                        'format_id': 'best',
-                        'ext': 'mp4',
-                        'height': 1080,
-                        'format_note': 'MP4'
-                    }],
-                    'extractor': info.get('extractor'),
-                    'webpage_url': info.get('webpage_url', url)
-                }
-            
+        _load_youtube_dl()
+        from yt_dlp.extractor import gen_extractors
+        list(gen_extractors())
+        get_ydl(INFO_YDL_OPTS)
+    except Exception as e:
+        logger.error("yt-dlp warmup failed: %s", e)
+
+if not os.getenv('SKIP_WARMUP'):
+    threading.Thread(target=_warm_yt_dlp, daemon=True).start()
+
+def get_video_info_cached(url, fast=False):
+    """TTL-cached video info fetch; concurrent lookups for the same URL
+    share a single in-flight future instead of each hitting yt-dlp"""
+    key = (url.strip(), fast)
+    with _INFO_LOCK:
+        info = _INFO_CACHE.get(key)
+        if info is not None:
+            return info
+        error = _INFO_NEG_CACHE.get(key)
+        if error is not None:
+            raise ValueError(error)
+        future = _INFO_FUTURES.get(key)
+        if future is None:
+            future = _INFO_FUTURES[key] = INFO_EXECUTOR.submit(_fetch_and_cache_info, key)
+    return future.result(timeout=15)
+
+def _fetch_and_cache_info(key):
+    try:
+        info = _fetch_video_info(key[0], key[1])
+        with _INFO_LOCK:
+            _INFO_CACHE[key] = info
+        return info
+    except Exception as e:
+        with _INFO_LOCK:
+            _INFO_NEG_CACHE[key] = str(e)
+        raise
+    finally:
+        with _INFO_LOCK:
+            _INFO_FUTURES.pop(key, None)
+
+def _fetch_video_info(url, fast=False):
+    """Highly optimized video info fetcher"""
+    try:
+        # Fast mode stops at the raw extractor result: process=False skips
+        # yt-dlp's format resolution/sorting pass entirely, and the formats
+        # list is dropped from the payload - /api/download re-extracts with
+        # the full pipeline when the formats are actually needed
+        info = get_ydl(INFO_YDL_OPTS).extract_info(
+            url, download=False, process=not fast
+        )
+
+        if not info:
+            raise ValueError("No video information could be extracted")
+
+        if fast:
+            # Unprocessed results may only carry a thumbnails list; the
+            # last entry is the highest resolution by yt-dlp convention
+            thumbnail = info.get('thumbnail')
+            if not thumbnail and info.get('thumbnails'):
+                thumbnail = info['thumbnails'][-1].get('url')
             return {
                 'title': info.get('title', 'Untitled'),
-                'thumbnail': info.get('thumbnail'),
+                'thumbnail': thumbnail,
                 'duration': info.get('duration'),
-                'formats': info.get('formats', []),
+                'formats': [],
+                'extractor': info.get('extractor'),
+                'webpage_url': info.get('webpage_url') or url,
+            }
+
+        # Platform-specific optimizations
+        if 'extractor' in info and info['extractor'] in ['instagram', 'facebook']:
+            return {
+                'title': info.get('title', 'Instagram Video') if 'instagram' in info['extractor'] else 'Facebook Video',
+                'thumbnail': info.get('thumbnail'),
+                'duration': info.get('duration', 0),
+                'formats': [{
+                    'format_id': 'best',
+                    'ext': 'mp4',
+                    'height': 1080,
+                    'format_note': 'MP4'
+                }],
                 'extractor': info.get('extractor'),
-                'webpage_url': info.get('webpage_url'),
+                'webpage_url': info.get('webpage_url', url)
             }
+
+        return {
+            'title': info.get('title', 'Untitled'),
+            'thumbnail': info.get('thumbnail'),
+            'duration': info.get('duration'),
+            'formats': info.get('formats', []),
+            'extractor': info.get('extractor'),
+            'webpage_url': info.get('webpage_url'),
+        }
     except Exception as e:
-        logger.error(f"Error getting video info: {str(e)}")
+        logger.error("Error getting video info: %s", e)
         raise
 
 def cleanup_old_files():
     """Fast cleanup with batch processing"""
     now = datetime.now()
     try:
-        with get_db() as conn:
-            # Get files to delete
-            old_files = conn.execute('''
-                SELECT filename FROM downloads 
-                WHERE completed_at < ? 
+        with get_db(write=True) as conn:
+            # One statement, one write-lock acquisition: DELETE..RETURNING
+            # hands back the expired names the old SELECT+DELETE pair
+            # scanned the index twice for. BEGIN IMMEDIATE takes the lock
+            # up front instead of upgrading mid-transaction.
+            conn.execute('BEGIN IMMEDIATE')
+            names = [row['filename'] for row in conn.execute('''
+                DELETE FROM downloads
+                WHERE completed_at < ?
                 AND status = 'completed'
-            ''', (now - CLEANUP_OLDER_THAN,)).fetchall()
-            
-            # Delete files in batch
-            deleted = 0
-            for file in old_files:
-                try:
-                    file_path = DOWNLOAD_FOLDER / file['filename']
-                    if file_path.exists():
-                        file_path.unlink()
-                        deleted += 1
-                except Exception as e:
-                    logger.error(f"Error deleting {file['filename']}: {str(e)}")
-            
-            # Update database
+                RETURNING filename
+            ''', (now - CLEANUP_OLDER_THAN,)).fetchall()]
+            # Expire stuck rows (crashed workers, failed jobs) in the same
+            # transaction - one commit per cleanup run, not per statement.
+            # Their files, if any, are caught by the orphan sweep below.
             conn.execute('''
-                DELETE FROM downloads 
-                WHERE completed_at < ? 
-                AND status = 'completed'
+                DELETE FROM downloads
+                WHERE started_at < ?
+                AND status != 'completed'
             ''', (now - CLEANUP_OLDER_THAN,))
             conn.commit()
-            
-            logger.info(f"Cleaned up {deleted} old files")
+
+        # Unlink relative to one directory fd: no per-file path resolution,
+        # and catching FileNotFoundError beats a stat() before every unlink.
+        # Spread the batch over a few threads so unlink latency overlaps
+        # (each release is a synchronous metadata write)
+        deleted = 0
+        if names:
+            dir_fd = os.open(DOWNLOAD_FOLDER, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+            def _safe_unlink(name):
+                try:
+                    os.unlink(name, dir_fd=dir_fd)
+                    return 1
+                except FileNotFoundError:
+                    return 0
+                except OSError as e:
+                    logger.error("Error deleting %s: %s", name, e)
+                    return 0
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+                    deleted = sum(pool.map(_safe_unlink, names))
+            finally:
+                os.close(dir_fd)
+        logger.info("Cleaned up %d old files", deleted)
+
+        # Sweep orphans the database doesn't know about (crashed downloads,
+        # files predating tracking). os.scandir yields DirEntry objects whose
+        # stat() reuses data from the directory read where the OS provides it.
+        # Compare raw mtimes against one precomputed float cutoff instead of
+        # allocating a datetime + timedelta per file
+        cutoff = time.time() - CLEANUP_OLDER_THAN.total_seconds()
+        orphans = 0
+        # One open directory fd for the whole sweep: unlinkat by name
+        # skips the per-file path resolution os.unlink(entry.path) pays,
+        # and follow_symlinks=False answers is_file from the dirent type
+        # without an extra stat on most filesystems
+        sweep_fd = os.open(DOWNLOAD_FOLDER, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        try:
+            with os.scandir(DOWNLOAD_FOLDER) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.unlink(entry.name, dir_fd=sweep_fd)
+                            orphans += 1
+                    except OSError as e:
+                        logger.error("Error deleting %s: %s", entry.name, e)
+        finally:
+            os.close(sweep_fd)
+        if orphans:
+            logger.info("Cleaned up %d orphaned files", orphans)
+
+        # Prune terminal jobs from the in-memory table so it stays bounded
+        # on long-lived workers; clients still polling an old id fall
+        # through to the downloads table
+        expiry = time.monotonic() - JOB_RETENTION_SECONDS
+        with _JOBS_LOCK:
+            stale = [
+                job_id for job_id, job in JOBS.items()
+                if job.get('ended_at', expiry) < expiry
+            ]
+            for job_id in stale:
+                del JOBS[job_id]
+        if stale:
+            logger.info("Pruned %d finished jobs", len(stale))
     except Exception as e:
-        logger.error(f"Cleanup failed: {str(e)}")
+        logger.error("Cleanup failed: %s", e)
 
 # Optimized routes
 @app.route('/api/info', methods=['GET'])
@@ -249,10 +663,13 @@ def video_info():
     if not url:
         return jsonify({'success': False, 'error': 'URL is required'}), 400
     
+    # fast=1 returns title/thumbnail/duration without the format list,
+    # deferring the expensive format extraction to download time
+    fast = request.args.get('fast', '0') == '1'
+
     try:
         # Check cache first
-        cache_key = int(time.time() / 60)  # Cache for 1 minute
-        info = get_video_info_cached(url, cache_key)
+        info = get_video_info_cached(url, fast=fast)
         
         # Check if we already have this file
         existing_file = check_existing_download(url)
@@ -270,7 +687,10 @@ def video_info():
 
 @app.route('/api/download', methods=['POST'])
 def download_video():
-    data = request.json
+    # silent=True returns None instead of raising on bad content-type;
+    # cache=True guarantees at most one parse if anything re-reads .json,
+    # and form-encoded clients fall back to request.form
+    data = request.get_json(silent=True, cache=True) or request.form or {}
     url = data.get('url')
     format_id = data.get('format_id', 'best')
     ip_address = request.remote_addr
@@ -290,82 +710,298 @@ def download_video():
                 'cached': True
             })
         
-        # Get video info
-        cache_key = int(time.time() / 60)
-        info = get_video_info_cached(url, cache_key)
-        safe_title = sanitize_filename(info['title'])
-        download_id = str(uuid.uuid4())
-        filename = f"{safe_title}_{download_id[:8]}.mp4"
-        filepath = DOWNLOAD_FOLDER / filename
-        
-        # Record download start
-        record_download_start(download_id, filename, url, ip_address)
-        
-        # Submit download task
-        DOWNLOAD_EXECUTOR.submit(
-            download_task, 
-            url, 
-            format_id, 
-            filepath, 
-            download_id
-        )
+        # Collapse duplicate requests onto the download already in flight.
+        # The slot is claimed atomically *before* the info fetch - a cold
+        # URL takes seconds to extract, and checking first/claiming later
+        # would let a burst of identical requests all slip past the check
+        inflight_key = (url, format_id)
+        # .hex skips the dashed-string formatting; plain os.path string
+        # joins keep Path object churn off the request path
+        download_id = uuid.uuid4().hex
+        with _JOBS_LOCK:
+            existing_id = INFLIGHT.setdefault(inflight_key, download_id)
+        if existing_id != download_id:
+            existing_job = JOBS.get(existing_id, {})
+            return jsonify({
+                'success': True,
+                'message': 'Download already in progress',
+                'filename': existing_job.get('filename'),
+                'download_url': f"/api/downloads/{quote(existing_job['filename'])}" if existing_job.get('filename') else None,
+                'download_id': existing_id,
+                'deduped': True
+            }), 202
+
+        try:
+            # Get video info
+            info = get_video_info_cached(url)
+            safe_title = sanitize_filename(info['title'])
+            filename = f"{safe_title}_{download_id[:8]}.mp4"
+            filepath = os.path.join(DOWNLOAD_FOLDER_STR, filename)
+
+            # Only run the ffmpeg convert pass when the chosen format is known
+            # to need it - for mp4 sources it is a full read+write of the file
+            selected_fmt = next(
+                (f for f in info.get('formats', []) if f.get('format_id') == format_id),
+                None
+            )
+            needs_convert = _needs_mp4_convert(selected_fmt)
+
+            # Record download start
+            record_download_start(download_id, filename, url, ip_address)
+            set_job_state(download_id, 'queued', filename=filename)
+
+            # Submit download task
+            DOWNLOAD_EXECUTOR.submit(
+                download_task,
+                url,
+                format_id,
+                filepath,
+                download_id,
+                needs_convert
+            )
+        except Exception:
+            # Free the reserved slot so the failure doesn't block retries
+            _release_inflight(url, format_id, download_id)
+            raise
         
+        # 202: the download continues in the background; poll /api/status
         return jsonify({
             'success': True,
             'message': 'Download started',
             'filename': filename,
             'download_url': f'/api/downloads/{quote(filename)}',
             'download_id': download_id
-        })
+        }), 202
     except Exception as e:
-        logger.error(f"Download failed: {str(e)}")
+        logger.error("Download failed: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def download_task(url, format_id, filepath, download_id):
+def _needs_mp4_convert(fmt):
+    """Decide from the in-memory format metadata whether an ffmpeg
+    re-encode is actually required. H.264 + AAC already fit the mp4
+    container, so those streams only need the merger's stream copy -
+    a container swap measured in seconds, not a transcode in minutes."""
+    if fmt is None:
+        return True  # unknown format: keep the safe full-convert path
+    if fmt.get('ext') == 'mp4':
+        return False
+    vcodec = (fmt.get('vcodec') or '').lower()
+    acodec = (fmt.get('acodec') or '').lower()
+    # 'none' means the stream is absent (audio-only / video-only formats)
+    if (vcodec == 'none' or vcodec.startswith(('avc1', 'h264'))) and (
+        acodec == 'none' or acodec.startswith(('mp4a', 'aac'))
+    ):
+        return False
+    return True
+
+def _build_download_opts(format_id):
+    """Static download options - everything that doesn't vary per job.
+    Transcoding happens on FFMPEG_EXECUTOR after the download, so no
+    convertor postprocessor runs inside yt-dlp itself."""
+    return {
+        'format': format_id,
+        'quiet': True,
+        'merge_output_format': 'mp4',
+        # Front-load the moov atom so browsers can start playback before
+        # the whole file arrives
+        'postprocessor_args': {
+            'merger': ['-movflags', '+faststart'],
+        },
+        'ignoreerrors': True,
+        'extractor_args': {
+            'youtube': {'skip': ['dash', 'hls']},
+            'instagram': {'extract_flat': True},
+            'facebook': {'extract_flat': True}
+        },
+        'retries': 3,
+        'fragment_retries': 3,
+        'skip_unavailable_fragments': True,
+        'http_chunk_size': 10 * 1024 * 1024,  # 10MB reads: fewer syscalls and hook callbacks
+        'buffersize': 1024 * 1024,
+        'cachedir': YDL_CACHE_DIR,
+        # Parallel segments for DASH/HLS extractors; per-connection rate
+        # limiting makes this the main throughput lever, so it's tunable
+        'concurrent_fragment_downloads': int(os.getenv('DL_FRAGS', 8)),
+    }
+
+# Download-mode instances are pooled per format_id and checked out
+# exclusively, so the per-job output template and progress hook can be
+# swapped between runs without racing another download. format_id is
+# client-supplied, so the pool is LRU-bounded instead of keeping an
+# instance alive for every distinct string ever POSTed
+_DL_YDL_POOL = collections.OrderedDict()  # format_id -> [idle instances]
+_DL_YDL_LOCK = threading.Lock()
+_DL_YDL_MAX_KEYS = 16
+_DL_YDL_PER_KEY = 4
+
+@contextmanager
+def _checkout_download_ydl(format_id, outtmpl, progress_hook):
+    key = format_id
+    with _DL_YDL_LOCK:
+        bucket = _DL_YDL_POOL.get(key)
+        ydl = bucket.pop() if bucket else None
+        if bucket is not None:
+            _DL_YDL_POOL.move_to_end(key)
+    if ydl is None:
+        ydl = _load_youtube_dl().YoutubeDL(_build_download_opts(format_id))
+        # One persistent hook per instance that dispatches to whatever the
+        # current job installed; add_progress_hook would leak if called
+        # once per download on a reused instance
+        holder = {'hook': None}
+        ydl._vidsuka_hook_holder = holder
+
+        def _dispatch(d, _holder=holder):
+            current = _holder['hook']
+            if current is not None:
+                current(d)
+
+        ydl.add_progress_hook(_dispatch)
+    ydl._vidsuka_hook_holder['hook'] = progress_hook
+    # yt-dlp normalizes outtmpl to a dict in __init__, so match that shape
+    ydl.params['outtmpl'] = {'default': outtmpl}
+    try:
+        yield ydl
+    finally:
+        ydl._vidsuka_hook_holder['hook'] = None
+        with _DL_YDL_LOCK:
+            bucket = _DL_YDL_POOL.setdefault(key, [])
+            if len(bucket) < _DL_YDL_PER_KEY:
+                bucket.append(ydl)
+            _DL_YDL_POOL.move_to_end(key)
+            # Evict the coldest keys; their idle instances just get GC'd
+            while len(_DL_YDL_POOL) > _DL_YDL_MAX_KEYS:
+                _DL_YDL_POOL.popitem(last=False)
+
+def _release_inflight(url, format_id, download_id):
+    """Release the dedup slot; completed files are served from the
+    downloads table on subsequent requests"""
+    with _JOBS_LOCK:
+        if INFLIGHT.get((url, format_id)) == download_id:
+            del INFLIGHT[(url, format_id)]
+
+def _convert_task(src, dst, download_id, url, format_id, stream_copy=False):
+    """Produce the mp4 at dst on the ffmpeg pool: a stream-copy remux
+    when the codecs already fit the container, a transcode otherwise"""
+    try:
+        codec_args = (
+            ['-c', 'copy'] if stream_copy
+            else ['-c:v', 'libx264', '-c:a', 'aac']
+        )
+        cmd = [
+            'ffmpeg', '-y', '-v', 'error', '-i', str(src),
+            *codec_args, '-movflags', '+faststart', str(dst),
+        ]
+        kwargs = {}
+        if hasattr(os, 'nice'):
+            # Deprioritize the transcode so ffmpeg's worker threads can't
+            # starve the request-serving threads of CPU
+            kwargs['preexec_fn'] = lambda: os.nice(10)
+        result = subprocess.run(cmd, capture_output=True, **kwargs)
+        if result.returncode != 0:
+            set_job_state(download_id, 'error', error='conversion failed')
+            logger.error(
+                "Conversion failed for %s: %s",
+                download_id, result.stderr.decode(errors='replace')[-300:]
+            )
+            return
+        try:
+            os.unlink(src)
+        except FileNotFoundError:
+            pass
+        record_download_complete(download_id, os.stat(dst).st_size, url)
+        set_job_state(download_id, 'completed', filename=dst.name)
+        logger.info("Successfully converted: %s", dst.name)
+    except Exception as e:
+        set_job_state(download_id, 'error', error=str(e))
+        logger.error("Conversion task failed: %s", e)
+    finally:
+        _release_inflight(url, format_id, download_id)
+
+def download_task(url, format_id, filepath, download_id, needs_convert=True):
     """Optimized download task with progress tracking"""
+    filepath = Path(filepath)  # workers can afford Path conveniences
+    set_job_state(download_id, 'started')
+    handed_off = False
     try:
-        ydl_opts = {
-            'format': format_id,
-            'outtmpl': str(filepath.with_suffix('')),
-            'quiet': True,
-            'merge_output_format': 'mp4',
-            'postprocessors': [{
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mp4',
-            }],
-            'ignoreerrors': True,
-            'extractor_args': {
-                'youtube': {'skip': ['dash', 'hls']},
-                'instagram': {'extract_flat': True},
-                'facebook': {'extract_flat': True}
-            },
-            'retries': 3,
-            'fragment_retries': 3,
-            'skip_unavailable_fragments': True,
-            'http_chunk_size': 1048576,  # 1MB chunks for faster downloads
-        }
-        
-        with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-        
-        # Handle the downloaded file
+        # Explicit %(ext)s so yt-dlp writes "<stem>.<real ext>" rather
+        # than an extensionless file the fallback has to hunt down
+        outtmpl = f"{filepath.with_suffix('')}.%(ext)s"
+
+        if not DOWNLOAD_SEMAPHORE.acquire(blocking=False):
+            logger.info("Download %s waiting for a free slot", download_id)
+            DOWNLOAD_SEMAPHORE.acquire()
+        try:
+            with _checkout_download_ydl(
+                format_id, outtmpl, make_progress_hook(download_id)
+            ) as ydl:
+                ydl.download([url])
+        finally:
+            DOWNLOAD_SEMAPHORE.release()
+
+        # The 'finished' hook records the exact path yt-dlp wrote, so there
+        # is no need to scan the whole folder for it. A merge may have
+        # swapped the extension to .mp4 afterwards, which is the only
+        # other place the file can be.
         if not filepath.exists():
-            downloaded_files = list(DOWNLOAD_FOLDER.glob(f"{filepath.stem}*"))
-            if downloaded_files:
-                filepath = downloaded_files[0]
-                if filepath.suffix.lower() != '.mp4':
-                    new_path = filepath.with_suffix('.mp4')
-                    filepath.rename(new_path)
-                    filepath = new_path
-        
-        # Record completion
-        if filepath.exists():
-            record_download_complete(download_id, filepath.stat().st_size)
-            logger.info(f"Successfully downloaded: {filepath.name}")
+            reported = _FINAL_PATHS.pop(download_id, None)
+            candidates = []
+            if reported:
+                reported = Path(reported)
+                candidates.append(reported)
+                candidates.append(reported.with_suffix('.mp4'))
+            candidates.append(filepath.with_suffix('.mp4'))
+            for candidate in candidates:
+                if candidate.exists():
+                    filepath = candidate
+                    break
+        else:
+            _FINAL_PATHS.pop(download_id, None)
+
+        suffix = filepath.suffix.lower()
+        if suffix != '.mp4' and filepath.exists():
+            target = filepath.with_suffix('.mp4')
+            if not needs_convert and suffix in ('.m4v', '.m4a', '.mov'):
+                # Already an ISO-BMFF container with mp4-ready codecs:
+                # relabeling really is enough. replace() overwrites
+                # atomically; rename() fails on Windows when the target
+                # exists
+                try:
+                    filepath.replace(target)
+                    filepath = target
+                except FileNotFoundError:
+                    pass
+            else:
+                # Hand the ffmpeg work to its own pool so this worker
+                # (and its download slot) frees up immediately; compatible
+                # codecs in a foreign container (mkv/webm/ts) get a
+                # seconds-long stream-copy remux, incompatible ones the
+                # full transcode. The convert task records completion and
+                # releases the dedup slot.
+                set_job_state(download_id, 'converting')
+                FFMPEG_EXECUTOR.submit(
+                    _convert_task, filepath, target, download_id, url,
+                    format_id, not needs_convert
+                )
+                handed_off = True
+                return
+
+        # Record completion; one stat covers both the existence check and
+        # the size instead of an exists() + stat() pair
+        try:
+            filesize = os.stat(filepath).st_size
+        except FileNotFoundError:
+            set_job_state(download_id, 'error', error='file not created')
+            logger.error("Download failed - file not created: %s", filepath.name)
         else:
-            logger.error(f"Download failed - file not created: {filepath.name}")
+            record_download_complete(download_id, filesize, url)
+            set_job_state(download_id, 'completed', filename=filepath.name)
+            logger.info("Successfully downloaded: %s", filepath.name)
     except Exception as e:
-        logger.error(f"Download task failed: {str(e)}")
+        set_job_state(download_id, 'error', error=str(e))
+        logger.error("Download task failed: %s", e)
+    finally:
+        if not handed_off:
+            _release_inflight(url, format_id, download_id)
 
 @app.route('/api/downloads/<path:filename>', methods=['GET'])
 def download_file(filename):
@@ -373,53 +1009,111 @@ def download_file(filename):
         decoded_filename = unquote(filename)
         
         # Ultra-fast validation
-        if not FILENAME_VALIDATE_PATTERN.match(decoded_filename):
-            logger.error(f"Invalid filename: {decoded_filename}")
+        if not _filename_ok(decoded_filename):
+            logger.error("Invalid filename: %s", decoded_filename)
             return jsonify({'success': False, 'error': 'Invalid filename'}), 400
             
         file_path = DOWNLOAD_FOLDER / decoded_filename
-        
-        # Security check
-        try:
-            file_path.resolve().relative_to(DOWNLOAD_FOLDER.resolve())
-        except ValueError:
-            logger.error(f"Path traversal attempt: {decoded_filename}")
+
+        # Security check: single realpath against the precomputed root
+        # instead of resolving both sides on every request
+        if not os.path.realpath(file_path).startswith(DOWNLOAD_ROOT):
+            logger.error("Path traversal attempt: %s", decoded_filename)
             return jsonify({'success': False, 'error': 'Invalid filename'}), 400
         
         if not file_path.exists():
-            logger.error(f"File not found: {decoded_filename}")
+            logger.error("File not found: %s", decoded_filename)
             return jsonify({'success': False, 'error': 'File not found'}), 404
             
-        filesize = file_path.stat().st_size
+        st = file_path.stat()
+        filesize = st.st_size
         if filesize == 0:
-            logger.error(f"Empty file: {decoded_filename}")
+            logger.error("Empty file: %s", decoded_filename)
             return jsonify({'success': False, 'error': 'File is empty'}), 500
-            
+
+        # Filenames carry a per-download UUID suffix, so the content behind
+        # a given name never changes - safe to cache aggressively
+        etag_value = f'{filesize}-{int(st.st_mtime)}'
+        cache_control = 'public, max-age=86400, immutable'
+
+        if request.if_none_match.contains(etag_value):
+            response = Response(status=304)
+            response.set_etag(etag_value)
+            response.headers['Cache-Control'] = cache_control
+            return response
+
         # Use efficient file serving
-        response = Response()
-        response.headers['Content-Type'] = 'video/mp4'
-        response.headers['Content-Disposition'] = f'attachment; filename="{decoded_filename}"'
-        response.headers['Content-Length'] = filesize
-        
-        if 'USE_X_SENDFILE' in os.environ:
+        accel_prefix = os.getenv('USE_X_ACCEL_REDIRECT')
+        if accel_prefix:
+            # Behind nginx: return an empty body and let nginx sendfile(2)
+            # the video from disk to socket with no user-space copy at all
+            response = Response(mimetype='video/mp4')
+            response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{quote(decoded_filename)}"
+            response.headers['Content-Disposition'] = f'attachment; filename="{decoded_filename}"'
+            response.headers['Accept-Ranges'] = 'bytes'
+        elif 'USE_X_SENDFILE' in os.environ:
+            # Hand the copy off to the front-end server entirely
+            response = Response()
+            response.headers['Content-Type'] = 'video/mp4'
+            response.headers['Content-Disposition'] = f'attachment; filename="{decoded_filename}"'
+            response.headers['Content-Length'] = filesize
             response.headers['X-Sendfile'] = str(file_path.absolute())
+            response.headers['Accept-Ranges'] = 'bytes'
         else:
-            response = send_file(
-                file_path,
-                as_attachment=True,
-                download_name=decoded_filename,
-                mimetype='video/mp4',
-                conditional=True
-            )
-            
+            # Full-file fast path: hand an open file straight to the server's
+            # wsgi.file_wrapper (waitress provides one) with a 64KB chunk size
+            # so bytes move via the server's optimized copy loop
+            wrapper = request.environ.get('wsgi.file_wrapper')
+            if wrapper is not None and 'Range' not in request.headers:
+                response = Response(
+                    wrapper(open(file_path, 'rb'), 65536),
+                    mimetype='video/mp4',
+                    direct_passthrough=True
+                )
+                response.headers['Content-Length'] = filesize
+                response.headers['Content-Disposition'] = f'attachment; filename="{decoded_filename}"'
+                response.headers['Accept-Ranges'] = 'bytes'
+            else:
+                # conditional=True lets the WSGI server use its file wrapper
+                # (sendfile where available) and serve Range requests, so
+                # client seeks/resumes transfer only the requested slice
+                response = send_file(
+                    file_path,
+                    as_attachment=True,
+                    download_name=decoded_filename,
+                    mimetype='video/mp4',
+                    conditional=True
+                )
+
+        response.set_etag(etag_value)
+        response.headers['Cache-Control'] = cache_control
         return response
     except Exception as e:
-        logger.error(f"Download failed: {str(e)}")
+        logger.error("Download failed: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/logs', methods=['GET'])
+def get_logs():
+    # Served from the in-memory ring buffer - no file I/O on this path
+    return jsonify({'success': True, 'logs': list(ring_handler.buf)[-10:]})
+
 @app.route('/api/status/<download_id>', methods=['GET'])
 def download_status(download_id):
     try:
+        # Live jobs are answered from memory in O(1); the database only
+        # serves downloads from before the last restart
+        job = JOBS.get(download_id)
+        if job is not None:
+            filename = job.get('filename')
+            return jsonify({
+                'success': True,
+                'status': job['state'],
+                'filename': filename,
+                'error': job.get('error'),
+                'progress': _PROGRESS.get(download_id),
+                'download_url': f"/api/downloads/{quote(filename)}" if job['state'] == 'completed' else None
+            })
+
         with get_db() as conn:
             download = conn.execute(
                 'SELECT status, filename FROM downloads WHERE id = ?',
@@ -433,6 +1127,7 @@ def download_status(download_id):
                 'success': True,
                 'status': download['status'],
                 'filename': download['filename'],
+                'progress': _PROGRESS.get(download_id),
                 'download_url': f"/api/downloads/{quote(download['filename'])}" if download['status'] == 'completed' else None
             })
     except Exception as e:
@@ -445,12 +1140,13 @@ def download_status(download_id):
 def startup():
     """Initial checks when server starts"""
     if not hasattr(app, 'has_run_startup'):
-        logger.info(f"Download folder: {DOWNLOAD_FOLDER.absolute()}")
-        logger.info(f"Download folder exists: {DOWNLOAD_FOLDER.exists()}")
-        logger.info(f"Download folder writable: {os.access(DOWNLOAD_FOLDER, os.W_OK)}")
-        logger.info(f"Files in download folder: {list(DOWNLOAD_FOLDER.iterdir())}")
+        # mkdir(exist_ok=True) at import time already guarantees the folder;
+        # re-checking existence/writability/contents here is redundant syscalls
+        logger.info("Download folder: %s", DOWNLOAD_FOLDER.absolute())
         init_db()
-        cleanup_old_files()
+        # Run the initial sweep in the background so the first request
+        # isn't held up by a directory scan
+        threading.Thread(target=cleanup_old_files, daemon=True).start()
         app.has_run_startup = True
 
 # Scheduled tasks
@@ -465,7 +1161,9 @@ if __name__ == '__main__':
         app,
         host="0.0.0.0",
         port=5000,
-        threads=8,  # Increased thread pool
-        channel_timeout=60,
+        # Requests spend their time blocked on yt-dlp network I/O, so
+        # threads are nearly free and directly bound concurrency
+        threads=int(os.getenv('WAITRESS_THREADS', 32)),
+        channel_timeout=120,
         connection_limit=1000
     )
\ No newline at end of file
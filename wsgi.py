@@ -0,0 +1,8 @@
+# Gunicorn entry point:
+#   gunicorn wsgi:app -w 2 -k gthread --threads 16 --timeout 600
+# The download workload is I/O bound, so threaded workers scale
+# near-linearly with the thread count.
+from app import app
+
+if __name__ == "__main__":
+    app.run()